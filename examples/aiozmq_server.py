@@ -14,7 +14,7 @@ async def main():
     while True:
         request = await rep.read()
         response = await dispatch(request[0].decode())
-        rep.write((str(response).encode(),))
+        rep.write((bytes(response),))
 
 
 if __name__ == "__main__":
@@ -17,7 +17,7 @@ class TestHttpServer(BaseHTTPRequestHandler):
         self.send_response(response.http_status)
         self.send_header("Content-type", "application/json")
         self.end_headers()
-        self.wfile.write(str(response).encode())
+        self.wfile.write(bytes(response))
 
 
 if __name__ == "__main__":
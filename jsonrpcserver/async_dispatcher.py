@@ -37,16 +37,23 @@ async def call(method: Method, *args: Any, **kwargs: Any) -> Any:
 async def safe_call(
     request: Request, methods: Methods, *, debug: bool, serialize: Callable
 ) -> Response:
-    with handle_exceptions(request, debug) as handler:
+    with handle_exceptions(request, debug, serialize) as handler:
         result = await call(
             lookup(methods, request.method), *request.args, **request.kwargs
         )
-        # Ensure value returned from the method is JSON-serializable. If not,
-        # handle_exception will set handler.response to an ExceptionResponse
-        serialize(result)
-        handler.response = SuccessResponse(
-            result=result, id=request.id, serialize_func=serialize
-        )
+        # Notifications get no response, so there's nothing to serialize or build;
+        # handle_exceptions will set handler.response to a NotificationResponse
+        if not request.is_notification:
+            # Ensure value returned from the method is JSON-serializable. If not,
+            # handle_exception will set handler.response to an ExceptionResponse. Keep
+            # the serialized result so the response doesn't serialize it again.
+            serialized_result = serialize(result)
+            handler.response = SuccessResponse(
+                result=result,
+                id=request.id,
+                serialize_func=serialize,
+                serialized_result=serialized_result,
+            )
     return handler.response
 
 
@@ -77,9 +84,9 @@ async def dispatch_pure(
     try:
         deserialized = validate(deserialize(request), schema)
     except JSONDecodeError as exc:
-        return InvalidJSONResponse(data=str(exc), debug=debug)
+        return InvalidJSONResponse(data=str(exc), debug=debug, serialize_func=serialize)
     except ValidationError as exc:
-        return InvalidJSONRPCResponse(data=None, debug=debug)
+        return InvalidJSONRPCResponse(data=None, debug=debug, serialize_func=serialize)
     return await call_requests(
         create_requests(
             deserialized, context=context, convert_camel_case=convert_camel_case
@@ -128,28 +128,37 @@ def call(method: Method, *args: Any, **kwargs: Any) -> Any:
 
 
 @contextmanager
-def handle_exceptions(request: Request, debug: bool) -> Generator:
+def handle_exceptions(
+    request: Request, debug: bool, serialize: Callable = default_serialize
+) -> Generator:
     handler = SimpleNamespace(response=None)
     try:
         yield handler
     except MethodNotFoundError:
         handler.response = MethodNotFoundResponse(
-            id=request.id, data=request.method, debug=debug
+            id=request.id, data=request.method, debug=debug, serialize_func=serialize
         )
     except (InvalidParamsError, AssertionError) as exc:
         # InvalidParamsError is raised by validate_args. AssertionError is raised inside
         # the methods, however it's better to raise InvalidParamsError inside methods.
         # AssertionError will be removed in the next major release.
         handler.response = InvalidParamsResponse(
-            id=request.id, data=str(exc), debug=debug
+            id=request.id, data=str(exc), debug=debug, serialize_func=serialize
         )
     except ApiError as exc:  # Method signals custom error
         handler.response = ApiErrorResponse(
-            str(exc), code=exc.code, data=exc.data, id=request.id, debug=debug
+            str(exc),
+            code=exc.code,
+            data=exc.data,
+            id=request.id,
+            debug=debug,
+            serialize_func=serialize,
         )
     except Exception as exc:  # Other error inside method - server error
         logging.exception(exc)
-        handler.response = ExceptionResponse(exc, id=request.id, debug=debug)
+        handler.response = ExceptionResponse(
+            exc, id=request.id, debug=debug, serialize_func=serialize
+        )
     finally:
         if request.is_notification:
             handler.response = NotificationResponse()
@@ -170,14 +179,21 @@ def safe_call(
     Returns:
         A Response object.
     """
-    with handle_exceptions(request, debug) as handler:
+    with handle_exceptions(request, debug, serialize) as handler:
         result = call(lookup(methods, request.method), *request.args, **request.kwargs)
-        # Ensure value returned from the method is JSON-serializable. If not,
-        # handle_exception will set handler.response to an ExceptionResponse
-        serialize(result)
-        handler.response = SuccessResponse(
-            result=result, id=request.id, serialize_func=serialize
-        )
+        # Notifications get no response, so there's nothing to serialize or build;
+        # handle_exceptions will set handler.response to a NotificationResponse
+        if not request.is_notification:
+            # Ensure value returned from the method is JSON-serializable. If not,
+            # handle_exception will set handler.response to an ExceptionResponse. Keep
+            # the serialized result so the response doesn't serialize it again.
+            serialized_result = serialize(result)
+            handler.response = SuccessResponse(
+                result=result,
+                id=request.id,
+                serialize_func=serialize,
+                serialized_result=serialized_result,
+            )
     return handler.response
 
 
@@ -258,9 +274,9 @@ def dispatch_pure(
     try:
         deserialized = validate(deserialize(request), schema)
     except JSONDecodeError as exc:
-        return InvalidJSONResponse(data=str(exc), debug=debug)
+        return InvalidJSONResponse(data=str(exc), debug=debug, serialize_func=serialize)
     except ValidationError as exc:
-        return InvalidJSONRPCResponse(data=None, debug=debug)
+        return InvalidJSONRPCResponse(data=None, debug=debug, serialize_func=serialize)
     return call_requests(
         create_requests(
             deserialized, context=context, convert_camel_case=convert_camel_case
@@ -31,23 +31,64 @@ Response heirarchy:
     BatchResponse - a list of DictResponses
 """
 from abc import ABC, abstractmethod
-from collections import OrderedDict
-from typing import Any, Dict, Iterable, cast, Callable
+from typing import Any, Dict, Iterable, Optional, Union, cast, Callable
 from json import dumps as default_serialize
 
 from . import status
 
 UNSPECIFIED = object()
 
+# A success response serialized by default_serialize always looks like this, so only the
+# result and id need serializing
+SUCCESS_TEMPLATE = '{"jsonrpc": "2.0", "result": %s, "id": %s}'
+
+
+def serialize_id(id: Any) -> str:
+    """
+    Serialize a request id the same way default_serialize would.
+
+    Ids are nearly always ints or null, which don't need the JSON encoder. Checks the
+    exact type because bool is a subclass of int, but serializes as true/false.
+    """
+    if type(id) is int:
+        return str(id)
+    if id is None:
+        return "null"
+    return default_serialize(id)
+
+
+def to_str(serialized: Union[str, bytes]) -> str:
+    """
+    Some serializers, such as orjson, give bytes rather than a string. Decode those so
+    str(response) always returns a string.
+    """
+    return serialized.decode() if isinstance(serialized, bytes) else serialized
+
+
+def to_bytes(serialized: Union[str, bytes]) -> bytes:
+    """
+    Encode a serialized response for sending, unless the serializer already gave bytes.
+    """
+    return serialized if isinstance(serialized, bytes) else serialized.encode()
+
 
 class Response(ABC):
-    """Base class of all responses."""
+    """
+    Base class of all responses.
+
+    Responses are created for every request, so all of them use __slots__ to keep them
+    small.
+    """
+
+    __slots__ = ("http_status", "_serialize", "_serialized")
 
     def __init__(
         self, http_status: int, serialize_func: Callable = default_serialize
     ) -> None:
         self.http_status = http_status
         self._serialize = serialize_func
+        # The output of the serializer, cached by serialized()
+        self._serialized = None  # type: Optional[Union[str, bytes]]
 
     @property
     @abstractmethod
@@ -60,6 +101,9 @@ class Response(ABC):
         Note that blocking/synchronous transfer protocols require a response to every
         request no matter what, in which case this property should be ignored and
         str(response) returned regardless.
+
+        The value is fixed for each class, so subclasses set it as a plain class
+        attribute rather than a property.
         """
 
 
@@ -72,47 +116,25 @@ class NotificationResponse(Response):
     with no `id` member).
     """
 
+    __slots__ = ()
+    wanted = False
+
     def __init__(self, http_status: int = status.HTTP_NO_CONTENT) -> None:
         super().__init__(http_status=http_status)
 
-    @property
-    def wanted(self) -> bool:
-        return False
-
     def __str__(self) -> str:
         return ""
 
-
-def sort_dict_response(response: Dict[str, Any]) -> OrderedDict:
-    """
-    Sort the keys of a dict, returning an OrderedDict.
-
-    This has no effect other than making it nicer to read. It's also only useful with
-    Python 3.5, since from 3.6 onwards, dictionaries hold their order.
-
-    Args:
-        response: The JSON-RPC response to sort.
-
-    Returns:
-        The same response, sorted as an OrderedDict.
-
-    Examples:
-        >>> json.dumps(sort_dict_response({'id': 2, 'result': 5, 'jsonrpc': '2.0'}))
-        {"jsonrpc": "2.0", "result": 5, "id": 1}
-    """
-    root_order = ["jsonrpc", "result", "error", "id"]
-    error_order = ["code", "message", "data"]
-    req = OrderedDict(sorted(response.items(), key=lambda k: root_order.index(k[0])))
-    if "error" in response:
-        req["error"] = OrderedDict(
-            sorted(response["error"].items(), key=lambda k: error_order.index(k[0]))
-        )
-    return req
+    def __bytes__(self) -> bytes:
+        return b""
 
 
 class DictResponse(Response):
     """Abstract..."""
 
+    __slots__ = ("id",)
+    wanted = True
+
     def __init__(self, *args: Any, id: Any, **kwargs: Any) -> None:
         """
         Args:
@@ -123,17 +145,32 @@ class DictResponse(Response):
         super().__init__(*args, **kwargs)
         self.id = id
 
-    @property
-    def wanted(self) -> bool:
-        return True
-
     @abstractmethod
     def deserialized(self) -> dict:
-        """Gets the response as a dictionary. Used by __str__."""
+        """
+        Gets the response as a dictionary. Used by serialized().
+
+        The keys should be in the order "jsonrpc", "result"/"error", "id", which is the
+        order they'll be serialized in. A new dict is returned on each call, so callers
+        are free to modify it; the serialized response is what's cached.
+        """
+
+    def serialized(self) -> Union[str, bytes]:
+        """
+        Gets the response as serialized by the serializer, which may be a string or
+        bytes. Serialized once, then cached.
+        """
+        if self._serialized is None:
+            self._serialized = self._serialize(self.deserialized())
+        return self._serialized
 
     def __str__(self) -> str:
         """Use str() to get the JSON-RPC response string."""
-        return self._serialize(sort_dict_response(self.deserialized()))
+        return to_str(self.serialized())
+
+    def __bytes__(self) -> bytes:
+        """Use bytes() to get the JSON-RPC response encoded, ready to send."""
+        return to_bytes(self.serialized())
 
 
 class SuccessResponse(DictResponse):
@@ -144,8 +181,15 @@ class SuccessResponse(DictResponse):
     result payload is expected back.
     """
 
+    __slots__ = ("result", "_serialized_result")
+
     def __init__(
-        self, result: Any, *, http_status: int = status.HTTP_OK, **kwargs: Any
+        self,
+        result: Any,
+        *,
+        http_status: int = status.HTTP_OK,
+        serialized_result: Optional[Union[str, bytes]] = None,
+        **kwargs: Any,
     ) -> None:
         """
         Args:
@@ -154,13 +198,24 @@ class SuccessResponse(DictResponse):
                 notification (i.e. the request id is `None`), the result must also be
                 `None` because notifications don't require any data returned.
             http_status:
+            serialized_result: The result, already serialized with serialize_func, if
+                the caller has it. Saves serializing the result a second time.
         """
         super().__init__(http_status=http_status, **kwargs)
         self.result = result
+        self._serialized_result = serialized_result
 
     def deserialized(self) -> dict:
         return {"jsonrpc": "2.0", "result": self.result, "id": self.id}
 
+    def serialized(self) -> Union[str, bytes]:
+        if self._serialized is None and self._serialize is default_serialize:
+            result = self._serialized_result
+            if result is None:
+                result = default_serialize(self.result)
+            self._serialized = SUCCESS_TEMPLATE % (result, serialize_id(self.id))
+        return super().serialized()
+
 
 class ErrorResponse(DictResponse):
     """
@@ -169,6 +224,8 @@ class ErrorResponse(DictResponse):
     Returned if there was an error while processing the request.
     """
 
+    __slots__ = ("code", "message", "data", "debug")
+
     def __init__(
         self,
         message: str,
@@ -196,17 +253,16 @@ class ErrorResponse(DictResponse):
         self.debug = debug
 
     def deserialized(self) -> dict:
-        dct = {
-            "jsonrpc": "2.0",
-            "error": {"code": self.code, "message": self.message},
-            "id": self.id,
-        }  # type: Dict[str, Any]
+        # Build the error member first, so the response dict is built in one go
+        error = {"code": self.code, "message": self.message}  # type: Dict[str, Any]
         if self.data is not UNSPECIFIED and self.debug:
-            dct["error"]["data"] = self.data
-        return dct
+            error["data"] = self.data
+        return {"jsonrpc": "2.0", "error": error, "id": self.id}
 
 
 class InvalidJSONResponse(ErrorResponse):
+    __slots__ = ()
+
     def __init__(
         self, *args: Any, http_status: int = status.HTTP_BAD_REQUEST, **kwargs: Any
     ) -> None:
@@ -223,6 +279,8 @@ class InvalidJSONResponse(ErrorResponse):
 
 
 class InvalidJSONRPCResponse(ErrorResponse):
+    __slots__ = ()
+
     def __init__(
         self, *args: Any, http_status: int = status.HTTP_BAD_REQUEST, **kwargs: Any
     ) -> None:
@@ -239,6 +297,8 @@ class InvalidJSONRPCResponse(ErrorResponse):
 
 
 class MethodNotFoundResponse(ErrorResponse):
+    __slots__ = ()
+
     def __init__(
         self, *args: Any, http_status: int = status.HTTP_NOT_FOUND, **kwargs: Any
     ) -> None:
@@ -252,6 +312,8 @@ class MethodNotFoundResponse(ErrorResponse):
 
 
 class InvalidParamsResponse(ErrorResponse):
+    __slots__ = ()
+
     def __init__(
         self, *args: Any, http_status: int = status.HTTP_BAD_REQUEST, **kwargs: Any
     ) -> None:
@@ -267,6 +329,8 @@ class InvalidParamsResponse(ErrorResponse):
 class ExceptionResponse(ErrorResponse):
     """Sent for unhandled exceptions - 'server error'."""
 
+    __slots__ = ("exc",)
+
     def __init__(
         self,
         exc: BaseException,
@@ -286,6 +350,8 @@ class ExceptionResponse(ErrorResponse):
 
 
 class ApiErrorResponse(ErrorResponse):
+    __slots__ = ()
+
     def __init__(
         self, *args: Any, http_status: int = status.HTTP_BAD_REQUEST, **kwargs: Any
     ) -> None:
@@ -299,6 +365,9 @@ class BatchResponse(Response):
     A collection of Responses, either success or error.
     """
 
+    __slots__ = ("responses",)
+    wanted = True
+
     def __init__(
         self,
         responses: Iterable[Response],
@@ -311,16 +380,49 @@ class BatchResponse(Response):
             Iterable[DictResponse], {r for r in responses if r.wanted}
         )
 
-    @property
-    def wanted(self) -> bool:
-        return True
-
     def deserialized(self) -> list:
         return [r.deserialized() for r in self.responses]
 
+    def packed(self) -> Union[Dict[str, Any], list]:
+        """
+        A compact form of the batch, for clients that have opted in to it. This is not
+        part of the JSON-RPC specification.
+
+        If every response is a success, the member names are given once rather than
+        repeated in every response:
+
+            {"jsonrpc": "2.0", "keys": ["result", "id"], "rows": [["foo", 1], ...]}
+
+        Otherwise the regular batch is returned, the same as deserialized(). That
+        includes an empty list if every request was a notification, in which case
+        nothing should be sent, as with str(response).
+        """
+        if self.responses and all(
+            isinstance(r, SuccessResponse) for r in self.responses
+        ):
+            return {
+                "jsonrpc": "2.0",
+                "keys": ["result", "id"],
+                "rows": [
+                    [r.result, r.id]
+                    for r in cast(Iterable[SuccessResponse], self.responses)
+                ],
+            }
+        return self.deserialized()
+
+    def serialized(self) -> Union[str, bytes]:
+        """The serialized batch, as given by the serializer. Cached."""
+        if self._serialized is None:
+            dicts = self.deserialized()
+            # For an all-notifications response, an empty string should be returned, as
+            # per spec
+            self._serialized = self._serialize(dicts) if len(dicts) else ""
+        return self._serialized
+
     def __str__(self) -> str:
         """JSON-RPC response string."""
-        dicts = self.deserialized()
-        # For an all-notifications response, an empty string should be returned, as per
-        # spec
-        return self._serialize(dicts) if len(dicts) else ""
+        return to_str(self.serialized())
+
+    def __bytes__(self) -> bytes:
+        """JSON-RPC response, encoded ready to send."""
+        return to_bytes(self.serialized())
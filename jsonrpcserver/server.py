@@ -15,7 +15,7 @@ class RequestHandler(BaseHTTPRequestHandler):
             self.send_response(response.http_status)
             self.send_header("Content-type", "application/json")
             self.end_headers()
-            self.wfile.write(str(response).encode())
+            self.wfile.write(bytes(response))
 
 
 def serve(name: str = "", port: int = 5000) -> None:
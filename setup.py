@@ -1,7 +1,23 @@
 """setup.py"""
+import os
 from codecs import open as codecs_open
 from setuptools import setup
 
+if os.environ.get("JSONRPCSERVER_CYTHONIZE"):
+    # Opt in to compiling the responses module, which is used for every request. This
+    # needs Cython and a C compiler at build time.
+    from Cython.Build import cythonize
+
+    EXT_MODULES = cythonize(
+        ["jsonrpcserver/response.py"],
+        language_level=3,
+        # Don't enforce argument annotations, so the compiled module accepts the same
+        # arguments as the pure Python one
+        compiler_directives={"annotation_typing": False},
+    )
+else:
+    EXT_MODULES = []
+
 with codecs_open("README.md", "r", "utf-8") as f:
     README = f.read()
 
@@ -14,6 +30,7 @@ setup(
         "Programming Language :: Python :: 3.8",
     ],
     description="Process JSON-RPC requests",
+    ext_modules=EXT_MODULES,
     extras_require={
         "tox": ["tox"],
         "examples": [
@@ -0,0 +1,53 @@
+import asyncio
+from unittest.mock import Mock
+
+from jsonrpcserver.async_dispatcher import dispatch_pure, default_deserialize
+from jsonrpcserver.methods import Methods
+from jsonrpcserver.request import NOCONTEXT
+from jsonrpcserver.response import InvalidJSONResponse, InvalidJSONRPCResponse
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+async def ping():
+    return "pong"
+
+
+def test_dispatch_pure_invalid_json_custom_serializer():
+    serialize = Mock(return_value="foo")
+    response = run(
+        dispatch_pure(
+            "{",
+            Methods(ping),
+            convert_camel_case=False,
+            context=NOCONTEXT,
+            debug=True,
+            serialize=serialize,
+            deserialize=default_deserialize,
+        )
+    )
+    assert isinstance(response, InvalidJSONResponse)
+    assert str(response) == "foo"
+
+
+def test_dispatch_pure_invalid_jsonrpc_custom_serializer():
+    serialize = Mock(return_value="foo")
+    response = run(
+        dispatch_pure(
+            "{}",
+            Methods(ping),
+            convert_camel_case=False,
+            context=NOCONTEXT,
+            debug=True,
+            serialize=serialize,
+            deserialize=default_deserialize,
+        )
+    )
+    assert isinstance(response, InvalidJSONRPCResponse)
+    assert str(response) == "foo"
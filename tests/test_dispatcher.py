@@ -1,6 +1,6 @@
 import logging
 from json import dumps as serialize
-from unittest.mock import sentinel
+from unittest.mock import Mock, patch, sentinel
 
 from jsonrpcserver.dispatcher import (
     add_handlers,
@@ -65,6 +65,16 @@ def test_safe_call_success_response():
     assert response.id == 1
 
 
+def test_safe_call_success_response_result_serialized_once():
+    serialize = Mock(wraps=default_serialize)
+    with patch("jsonrpcserver.response.default_serialize", serialize):
+        response = safe_call(
+            Request(method="ping", id=1), Methods(ping), debug=True, serialize=serialize
+        )
+        assert str(response) == '{"jsonrpc": "2.0", "result": "pong", "id": 1}'
+    serialize.assert_called_once_with("pong")
+
+
 def test_safe_call_notification():
     response = safe_call(
         Request(method="ping"), Methods(ping), debug=True, serialize=default_serialize
@@ -72,6 +82,15 @@ def test_safe_call_notification():
     assert isinstance(response, NotificationResponse)
 
 
+def test_safe_call_notification_result_not_serialized():
+    serialize = Mock()
+    response = safe_call(
+        Request(method="ping"), Methods(ping), debug=True, serialize=serialize
+    )
+    assert isinstance(response, NotificationResponse)
+    serialize.assert_not_called()
+
+
 def test_safe_call_notification_failure():
     def fail():
         raise ValueError()
@@ -92,6 +111,17 @@ def test_safe_call_method_not_found():
     assert isinstance(response, MethodNotFoundResponse)
 
 
+def test_safe_call_method_not_found_custom_serializer():
+    serialize = Mock(return_value="foo")
+    response = safe_call(
+        Request(method="nonexistant", id=1),
+        Methods(ping),
+        debug=True,
+        serialize=serialize,
+    )
+    assert str(response) == "foo"
+
+
 def test_safe_call_invalid_args():
     response = safe_call(
         Request(method="ping", params=[1], id=1),
@@ -263,6 +293,20 @@ def test_dispatch_pure_invalid_json():
     assert isinstance(response, InvalidJSONResponse)
 
 
+def test_dispatch_pure_invalid_json_custom_serializer():
+    serialize = Mock(return_value="foo")
+    response = dispatch_pure(
+        "{",
+        Methods(ping),
+        convert_camel_case=False,
+        context=NOCONTEXT,
+        debug=True,
+        serialize=serialize,
+        deserialize=default_deserialize,
+    )
+    assert str(response) == "foo"
+
+
 def test_dispatch_pure_invalid_jsonrpc():
     """Invalid JSON-RPC, must return an error. (impossible to determine if notification)"""
     response = dispatch_pure(
@@ -1,4 +1,5 @@
 import json
+from unittest.mock import Mock
 
 import pytest
 
@@ -14,7 +15,6 @@ from jsonrpcserver.response import (
     NotificationResponse,
     Response,
     SuccessResponse,
-    sort_dict_response,
 )
 
 
@@ -43,6 +43,10 @@ def test_notification_response_str():
     assert str(NotificationResponse()) == ""
 
 
+def test_notification_response_bytes():
+    assert bytes(NotificationResponse()) == b""
+
+
 def test_batch_response():
     response = BatchResponse(
         {SuccessResponse("foo", id=1), SuccessResponse("bar", id=2)}
@@ -56,27 +60,54 @@ def test_batch_response():
         assert r in expected
 
 
-def test_sort_dict_response_success():
-    response = sort_dict_response({"id": 1, "result": 5, "jsonrpc": "2.0"})
-    assert json.dumps(response) == '{"jsonrpc": "2.0", "result": 5, "id": 1}'
+def test_batch_response_str_bytes_serializer():
+    response = BatchResponse(
+        [SuccessResponse("foo", id=1)],
+        serialize_func=lambda obj: json.dumps(obj).encode(),
+    )
+    assert str(response) == '[{"jsonrpc": "2.0", "result": "foo", "id": 1}]'
 
 
-def test_sort_dict_response_error():
-    response = sort_dict_response(
-        {
-            "id": 1,
-            "error": {
-                "data": "bar",
-                "message": "foo",
-                "code": status.JSONRPC_INVALID_REQUEST_CODE,
-            },
-            "jsonrpc": "2.0",
-        }
-    )
-    assert (
-        json.dumps(response)
-        == '{"jsonrpc": "2.0", "error": {"code": -32600, "message": "foo", "data": "bar"}, "id": 1}'
+def test_batch_response_str_cached():
+    serialize = Mock(return_value='[{"jsonrpc": "2.0", "result": "foo", "id": 1}]')
+    response = BatchResponse([SuccessResponse("foo", id=1)], serialize_func=serialize)
+    assert str(response) == str(response)
+    serialize.assert_called_once()
+
+
+def test_batch_response_bytes():
+    response = BatchResponse([SuccessResponse("foo", id=1)])
+    assert bytes(response) == b'[{"jsonrpc": "2.0", "result": "foo", "id": 1}]'
+
+
+def test_batch_response_bytes_all_notifications():
+    assert bytes(BatchResponse([NotificationResponse()])) == b""
+
+
+def test_batch_response_packed():
+    response = BatchResponse([SuccessResponse("foo", id=1), NotificationResponse()])
+    assert response.packed() == {
+        "jsonrpc": "2.0",
+        "keys": ["result", "id"],
+        "rows": [["foo", 1]],
+    }
+
+
+def test_batch_response_packed_with_error():
+    response = BatchResponse(
+        [
+            SuccessResponse("foo", id=1),
+            ErrorResponse("bar", id=2, code=-1, debug=True, http_status=200),
+        ]
     )
+    assert response.packed() == response.deserialized()
+
+
+def test_batch_response_packed_all_notifications():
+    # Falsy, like str(response), to signal there's nothing to send
+    response = BatchResponse([NotificationResponse()])
+    assert response.packed() == response.deserialized() == []
+    assert not response.packed() and not str(response)
 
 
 def test_success_response():
@@ -86,11 +117,72 @@ def test_success_response():
     assert str(response) == '{"jsonrpc": "2.0", "result": "foo", "id": 1}'
 
 
+def test_success_response_deserialized_not_shared():
+    # Each call gives a new dict, so modifying one doesn't change the response
+    response = SuccessResponse("foo", id=1)
+    response.deserialized()["id"] = 2
+    assert response.deserialized()["id"] == 1
+    assert json.loads(str(response))["id"] == 1
+
+
+def test_success_response_slots():
+    assert not hasattr(SuccessResponse("foo", id=1), "__dict__")
+
+
 def test_success_response_str():
     response = SuccessResponse("foo", id=1)
     assert str(response) == '{"jsonrpc": "2.0", "result": "foo", "id": 1}'
 
 
+def test_success_response_str_cached():
+    serialize = Mock(return_value='{"jsonrpc": "2.0", "result": "foo", "id": 1}')
+    response = SuccessResponse("foo", id=1, serialize_func=serialize)
+    assert str(response) == str(response)
+    serialize.assert_called_once()
+
+
+def test_success_response_str_bytes_serializer():
+    # Serializers like orjson return bytes
+    response = SuccessResponse(
+        "foo", id=1, serialize_func=lambda obj: json.dumps(obj).encode()
+    )
+    assert str(response) == '{"jsonrpc": "2.0", "result": "foo", "id": 1}'
+
+
+@pytest.mark.parametrize(
+    "result, id",
+    [
+        ("foo", 1),
+        (5, "abc"),
+        ({"foo": [1, "%s", None]}, 1.5),
+        ("\u20ac", None),
+        (None, -1),
+        (None, True),
+    ],
+)
+def test_success_response_str_same_as_serialized(result, id):
+    response = SuccessResponse(result, id=id)
+    assert str(response) == json.dumps(response.deserialized())
+
+
+def test_success_response_bytes():
+    response = SuccessResponse("foo", id=1)
+    assert bytes(response) == b'{"jsonrpc": "2.0", "result": "foo", "id": 1}'
+
+
+def test_success_response_bytes_bytes_serializer():
+    # Bytes from the serializer are sent as they are, not decoded and re-encoded
+    serialized = b'{"jsonrpc":"2.0","result":"foo","id":1}'
+    response = SuccessResponse("foo", id=1, serialize_func=lambda obj: serialized)
+    assert bytes(response) is serialized
+
+
+def test_success_response_serialized_result():
+    # An already-serialized result is used as-is
+    response = SuccessResponse("foo", id=1, serialized_result='"bar"')
+    assert str(response) == '{"jsonrpc": "2.0", "result": "bar", "id": 1}'
+
+
 def test_success_response_null_id():
     # OK - any type of id is acceptable
     response = SuccessResponse("foo", id=None)
@@ -114,6 +206,28 @@ def test_error_response():
     )
 
 
+def test_error_response_deserialized_not_shared():
+    # Each call gives a new dict, so modifying one doesn't change the response
+    response = ErrorResponse("foo", id=1, code=-1, debug=True, http_status=200)
+    response.deserialized()["id"] = 2
+    assert response.deserialized()["id"] == 1
+    assert json.loads(str(response))["id"] == 1
+
+
+def test_error_response_slots():
+    response = ExceptionResponse(ValueError("foo"), id=1, debug=True)
+    assert not hasattr(response, "__dict__")
+
+
+def test_error_response_str_subclass_message():
+    # Annotations aren't enforced, including when the module is compiled with Cython
+    class Message(str):
+        pass
+
+    response = ErrorResponse(Message("foo"), id=1, code=-1, debug=True, http_status=200)
+    assert response.message == "foo"
+
+
 def test_error_response_no_id():
     # Responding with an error to a Notification - this is OK; we do respond to
     # notifications under certain circumstances, such as "invalid json" and "invalid